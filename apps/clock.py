@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # PiGames/apps/clock.py
+import math
 import time
 import curses
 from datetime import datetime
@@ -41,6 +42,28 @@ COLON = ["0000000","0011000","0011000","0000000","0011000","0011000","0000000"]
 DIGIT_H = len(next(iter(DIGITS.values())))
 DIGIT_W = len(next(iter(DIGITS.values())))
 
+# Precomputed per-row (col_offset, pixel_string) spans of contiguous "1"s,
+# built once at import so frames are populated without re-scanning the bitmap
+# strings per glyph per frame.
+def _glyph_runs(rows):
+    runs = []
+    for row in rows:
+        row_runs = []
+        c = 0
+        while c < len(row):
+            if row[c] == "1":
+                start = c
+                while c < len(row) and row[c] == "1":
+                    c += 1
+                row_runs.append((start, PIX * (c - start)))
+            else:
+                c += 1
+        runs.append(row_runs)
+    return runs
+
+GLYPH_RUNS = {ch: _glyph_runs(rows) for ch, rows in DIGITS.items()}
+GLYPH_RUNS[":"] = _glyph_runs(COLON)
+
 # lazy-initialized attrs (after curses starts)
 _ATTRS_READY = False
 _ATTR_DIGIT = 0
@@ -65,42 +88,109 @@ def _init_attrs():
     _ATTR_DATE  = _attr_for(DATE_FG,  None)
     _ATTRS_READY = True
 
-def render_big_text(stdscr, top, left, text, colon_on=True):
-    gap = 2
+# Shadow buffer: (y, x) -> (ch, attr) of every cell currently on screen, so a
+# frame only touches the terminal where it differs from the previous one.
+# Keyed per cell, not per span: span keys miss the stale tail when a glyph
+# transition shortens a run starting at the same offset (e.g. seconds 2→3).
+_SHADOW = {}
+_SHADOW_SIZE = (0, 0)
+
+# Formatted strings are identical for every frame within the same second, so
+# cache them (strftime especially is slow) and rebuild only when the second
+# or a display toggle changes.
+_LAST_TIME_KEY = None
+_LAST_TSTR = ""
+_LAST_DATESTR = ""
+_LAST_COLON = True
+
+def _time_strings(now):
+    global _LAST_TIME_KEY, _LAST_TSTR, _LAST_DATESTR, _LAST_COLON
+    key = (now.year, now.month, now.day, now.hour, now.minute, now.second,
+           USE_24H, SHOW_SECONDS, BLINK_COLON)
+    if key != _LAST_TIME_KEY:
+        hour = now.hour if USE_24H else (now.hour % 12 or 12)
+        hh = f"{hour:02d}"
+        mm = f"{now.minute:02d}"
+        ss = f"{now.second:02d}"
+        _LAST_TSTR = f"{hh}:{mm}:{ss}" if SHOW_SECONDS else f"{hh}:{mm}"
+        _LAST_DATESTR = now.strftime("%a %Y-%m-%d")
+        _LAST_COLON = (now.second % 2 == 0) if BLINK_COLON else True
+        _LAST_TIME_KEY = key
+    return _LAST_TSTR, _LAST_DATESTR, _LAST_COLON
+
+GLYPH_GAP = 2
+
+# The clock string is always HH:MM or HH:MM:SS, so each slot's x-offset and
+# colon-ness are fixed per string length — precompute them and render digits
+# and colons in separate passes with no per-glyph branching.
+def _layout_for(n):
+    pattern = "00:00:00"[:n]
+    return [(i, i * (DIGIT_W + GLYPH_GAP), ch == ":") for i, ch in enumerate(pattern)]
+
+_LAYOUTS = {n: _layout_for(n) for n in (5, 8)}
+
+def _put_glyph(frame, top, x_base, runs, attr):
     for r in range(DIGIT_H):
-        x = left
-        for i, ch in enumerate(text):
-            glyph = (COLON if ch == ":" else DIGITS[ch])
-            row = glyph[r]
-            attr = _ATTR_COLON if ch == ":" else _ATTR_DIGIT
-            if ch == ":" and not colon_on:
-                attr = _ATTR_DIGIT
-            for c, bit in enumerate(row):
-                if bit == "1":
-                    try:
-                        stdscr.addstr(top + r, x + c, PIX, attr)
-                    except curses.error:
-                        pass
-            x += DIGIT_W + gap
+        y = top + r
+        for off, span in runs[r]:
+            x = x_base + off
+            for j, px in enumerate(span):
+                frame[(y, x + j)] = (px, attr)
+
+def render_big_text(frame, top, left, text, colon_on=True):
+    layout = _LAYOUTS.get(len(text)) or _layout_for(len(text))
+    # local bindings: avoid LOAD_ATTR / LOAD_GLOBAL in the inner loops
+    glyph_runs = GLYPH_RUNS
+    attr_digit = _ATTR_DIGIT
+    for i, x_off, is_colon in layout:
+        if not is_colon:
+            _put_glyph(frame, top, left + x_off, glyph_runs[text[i]], attr_digit)
+    if colon_on:
+        colon_runs = glyph_runs[":"]
+        attr_colon = _ATTR_COLON
+        for i, x_off, is_colon in layout:
+            if is_colon:
+                _put_glyph(frame, top, left + x_off, colon_runs, attr_colon)
+
+def _flush_frame(stdscr, frame):
+    """Diff `frame` against the shadow buffer and draw only cells that changed."""
+    global _SHADOW
+    addstr = stdscr.addstr
+    cerr = curses.error
+    # clear cells that vanished (e.g. layout shift, colon blinked off)
+    for key in _SHADOW:
+        if key not in frame:
+            try:
+                addstr(key[0], key[1], " ")
+            except cerr:
+                pass
+    # draw new or changed cells
+    shadow_get = _SHADOW.get
+    for key, val in frame.items():
+        if shadow_get(key) != val:
+            try:
+                addstr(key[0], key[1], val[0], val[1])
+            except cerr:
+                pass
+    _SHADOW = frame
 
 def update_draw(stdscr, dt):
+    global _SHADOW_SIZE
     if not _ATTRS_READY:
         _init_attrs()
 
-    stdscr.erase()
     h, w = stdscr.getmaxyx()
+    if (h, w) != _SHADOW_SIZE:
+        # terminal resized: the shadow no longer matches reality
+        _SHADOW.clear()
+        _SHADOW_SIZE = (h, w)
+        stdscr.erase()
 
     now = datetime.now()
-    hour = now.hour if USE_24H else (now.hour % 12 or 12)
-    hh = f"{hour:02d}"
-    mm = f"{now.minute:02d}"
-    ss = f"{now.second:02d}"
-    tstr = f"{hh}:{mm}:{ss}" if SHOW_SECONDS else f"{hh}:{mm}"
-    colon_on = (now.second % 2 == 0) if BLINK_COLON else True
+    tstr, datestr, colon_on = _time_strings(now)
 
     glyphs = len(tstr)
-    gap = 2
-    clock_w = glyphs * DIGIT_W + (glyphs - 1) * gap
+    clock_w = glyphs * DIGIT_W + (glyphs - 1) * GLYPH_GAP
     clock_h = DIGIT_H
 
     area_w = clock_w + 2 * PADDING_X
@@ -109,19 +199,23 @@ def update_draw(stdscr, dt):
     top = max(0, (h - area_h) // 2) + PADDING_Y
     left = max(0, (w - area_w) // 2) + PADDING_X
 
-    render_big_text(stdscr, top, left, tstr, colon_on=colon_on)
+    frame = {}
+    render_big_text(frame, top, left, tstr, colon_on=colon_on)
 
     if DATE_BELOW:
-        datestr = now.strftime("%a %Y-%m-%d")
         y = top + DIGIT_H
         x = max(0, (w - len(datestr)) // 2)
-        try:
-            stdscr.addstr(y, x, datestr, _ATTR_DATE)
-        except curses.error:
-            pass
+        for j, c in enumerate(datestr):
+            frame[(y, x + j)] = (c, _ATTR_DATE)
 
+    _flush_frame(stdscr, frame)
     stdscr.refresh()
 
+    # content only changes on half-second ticks (colon blink), so ask the
+    # mainloop to sleep until the next one instead of polling at full fps
+    t = time.time()
+    return max(0.0, (math.floor(t * 2) + 1) / 2 - t)
+
 def handle_key(stdscr, ch):
     global USE_24H, SHOW_SECONDS, BLINK_COLON
     if ch in (ord('s'),):
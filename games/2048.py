@@ -2,8 +2,11 @@
 # Imports
 import curses
 import random
+import sys
 from ..lib.curses_util import mainloop
 from ..lib.colors import get_color
+from ._2048_core import (compress_line, move_left_bb, move_right_bb,
+                         move_up_bb, move_down_bb)
 
 # =======================
 # Tunables / “theme” bits
@@ -31,10 +34,53 @@ MENU_FG     = ("black", "base")
 MENU_PADDING_X = 2
 MENU_PADDING_Y = 1
 
+# Tile palette: a small cycle through named colors, indexed by exponent
+TILE_PALETTE = [
+    ("blue", "light"),
+    ("cyan", "base"),
+    ("green", "base"),
+    ("yellow", "base"),
+    ("orange", "base"),
+    ("magenta", "base"),
+    ("red", "base"),
+    ("purple", "base"),
+    ("gold", "base"),
+    ("pink", "base"),
+    ("lime", "base"),
+    ("blue", "base"),
+    ("cyan", "light"),
+    ("green", "light"),
+    ("yellow", "light"),
+    ("orange", "light"),
+]
+
+# Attributes precomputed on the first frame (color pairs need curses started):
+# every per-frame get_color call collapses into a list/variable lookup.
+_ATTRS_READY = False
+_TILE_ATTRS: list = []     # indexed by tile exponent (1..31)
+_ZERO_TILE_ATTR = 0
+_MENU_ATTR = 0
+_BORDER_ATTR = 0
+_GAP_ATTR = 0
+
+def _init_2048_attrs():
+    global _ATTRS_READY, _TILE_ATTRS, _ZERO_TILE_ATTR
+    global _MENU_ATTR, _BORDER_ATTR, _GAP_ATTR
+    if _ATTRS_READY:
+        return
+    _TILE_ATTRS = [0]  # exponent 0 unused; see _ZERO_TILE_ATTR
+    _TILE_ATTRS += [get_color(bg=TILE_PALETTE[(e - 1) % len(TILE_PALETTE)])
+                    for e in range(1, 32)]  # auto-contrast fg
+    _ZERO_TILE_ATTR = get_color(bg=("gray", "base"))
+    _MENU_ATTR = get_color(bg=MENU_BG, fg=MENU_FG)
+    _BORDER_ATTR = get_color(bg=BORDER_BG, fg=BORDER_FG)
+    _GAP_ATTR = get_color(bg=GAP_BG, fg=GAP_FG)
+    _ATTRS_READY = True
+
 # =====================
 # Number formatting util
 # =====================
-def fmt_tile(v: int) -> str:
+def _fmt_tile_uncached(v: int) -> str:
     if v == 0:
         return "."
     units = [(1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K")]
@@ -45,6 +91,17 @@ def fmt_tile(v: int) -> str:
             return s[:4]
     return str(v)[:4]
 
+# Tiles are always powers of two, so every reachable label can be built once
+# at import (interned, so addstr sees the same string objects every frame).
+_TILE_STR = {0: sys.intern(_fmt_tile_uncached(0))}
+for _k in range(1, 41):
+    _TILE_STR[1 << _k] = sys.intern(_fmt_tile_uncached(1 << _k))
+del _k
+
+def fmt_tile(v: int) -> str:
+    s = _TILE_STR.get(v)
+    return s if s is not None else _fmt_tile_uncached(v)
+
 # =================
 # Board mechanics
 # =================
@@ -54,80 +111,85 @@ def new_board():
     return b
 
 def spawn(b):
-    empties = [(r, c) for r in range(SIZE) for c in range(SIZE) if b[r][c] == 0]
-    if not empties:
+    # count empties, then drop the tile into the k-th one — no list built
+    empty_count = 0
+    for r in range(SIZE):
+        row = b[r]
+        for c in range(SIZE):
+            if row[c] == 0:
+                empty_count += 1
+    if not empty_count:
         return
-    r, c = random.choice(empties)
-    b[r][c] = 4 if random.random() < 0.1 else 2
-
-def compress_line(line):
-    """Left-compress + merge once per pair; returns (new_line, moved, gained_score)."""
-    xs = [x for x in line if x]
-    out, i, gained = [], 0, 0
-    while i < len(xs):
-        if i + 1 < len(xs) and xs[i] == xs[i + 1]:
-            v = xs[i] * 2
-            out.append(v)
-            gained += v
-            i += 2
-        else:
-            out.append(xs[i])
-            i += 1
-    out += [0] * (len(line) - len(out))
-    moved = out != line
-    return out, moved, gained
+    k = random.randrange(empty_count)
+    v = 4 if random.random() < 0.1 else 2
+    for r in range(SIZE):
+        row = b[r]
+        for c in range(SIZE):
+            if row[c] == 0:
+                if k == 0:
+                    row[c] = v
+                    return
+                k -= 1
+
+# Bitboard machinery (exponent nibbles in a uint64, table-driven moves) lives
+# in _2048_core; this file only adapts the list-of-lists board to it.
+
+def encode_board(b):
+    """Pack a SIZE x SIZE list board into a 64-bit exponent bitboard."""
+    bb = 0
+    shift = 0
+    for row in b:
+        for v in row:
+            if v:
+                bb |= (v.bit_length() - 1) << shift
+            shift += 4
+    return bb
+
+def decode_board(bb, out=None):
+    """Unpack a bitboard into a SIZE x SIZE list of tile values.
+
+    With `out` given, writes into its existing rows (no allocation).
+    """
+    if out is None:
+        out = [[0] * SIZE for _ in range(SIZE)]
+    shift = 0
+    for r in range(SIZE):
+        row = out[r]
+        for c in range(SIZE):
+            e = (bb >> shift) & 0xF
+            row[c] = 0 if e == 0 else 1 << e
+            shift += 4
+    return out
+
+# Thin wrappers keeping the list-of-lists API so spawn/draw code is unchanged.
+def _apply_move_bb(b, move_bb):
+    bb = encode_board(b)
+    nb, gained = move_bb(bb)
+    if nb == bb:
+        return False, 0
+    decode_board(nb, b)
+    return True, gained
 
 def move_left(b):
-    moved = False
-    gained = 0
-    for r in range(SIZE):
-        new, ch, sc = compress_line(b[r])
-        b[r] = new
-        moved = moved or ch
-        gained += sc
-    return moved, gained
+    return _apply_move_bb(b, move_left_bb)
 
 def move_right(b):
-    moved = False
-    gained = 0
-    for r in range(SIZE):
-        rev = list(reversed(b[r]))
-        new, ch, sc = compress_line(rev)
-        b[r] = list(reversed(new))
-        moved = moved or ch
-        gained += sc
-    return moved, gained
-
-def transpose(b):
-    return [list(row) for row in zip(*b)]
+    return _apply_move_bb(b, move_right_bb)
 
 def move_up(b):
-    t = transpose(b)
-    ch, sc = move_left(t)
-    nb = transpose(t)
-    for r in range(SIZE):
-        b[r] = nb[r]
-    return ch, sc
+    return _apply_move_bb(b, move_up_bb)
 
 def move_down(b):
-    t = transpose(b)
-    ch, sc = move_right(t)
-    nb = transpose(t)
-    for r in range(SIZE):
-        b[r] = nb[r]
-    return ch, sc
+    return _apply_move_bb(b, move_down_bb)
 
 def has_moves(b):
-    if any(0 in row for row in b):
+    bb = encode_board(b)
+    # zero-nibble test: any empty cell means a move exists
+    if (bb - 0x1111111111111111) & ~bb & 0x8888888888888888:
         return True
-    for r in range(SIZE):
-        for c in range(SIZE):
-            v = b[r][c]
-            if r + 1 < SIZE and b[r + 1][c] == v:
-                return True
-            if c + 1 < SIZE and b[r][c + 1] == v:
-                return True
-    return False
+    # full board: a horizontal (vertical) merge exists iff a left (up) move
+    # changes the board — right/down tests would be redundant here
+    return move_left_bb(bb)[0] != bb or move_up_bb(bb)[0] != bb
 
 def max_tile(b):
     return max(max(row) for row in b)
@@ -142,12 +204,21 @@ won = False
 # ===============
 # Small draw utils
 # ===============
+# blank-row strings reused across frames instead of rebuilt per addstr
+_BLANK_TILE_ROW = " " * TILE_W
+_blank_cache: dict = {}
+
 def draw_rect(stdscr, y, x, h, w, attr):
     """Fill rectangle [y..y+h-1] x [x..x+w-1] with spaces in attr."""
+    addstr = stdscr.addstr
+    cerr = curses.error
+    blank = _blank_cache.get(w)
+    if blank is None:
+        blank = _blank_cache.setdefault(w, " " * max(0, w))
     for yy in range(h):
         try:
-            stdscr.addstr(y + yy, x, " " * max(0, w), attr)
-        except curses.error:
+            addstr(y + yy, x, blank, attr)
+        except cerr:
             pass
 
 def draw_text_center(stdscr, y, x, w, text, attr):
@@ -156,11 +227,22 @@ def draw_text_center(stdscr, y, x, w, text, attr):
     except curses.error:
         pass
 
+# Offscreen pad holding the bordered board; built lazily (board geometry is
+# fixed by the tunables, so it never needs resizing). Pushing it with
+# noutrefresh + one doupdate lets ncurses diff and flush the whole board in
+# a single screen update instead of many per-call refreshes.
+_BOARD_PAD = None
+
+# The board only changes on a keypress (or resize), so frames in between are
+# skipped entirely rather than repainted identically at 60 FPS.
+_DIRTY = True
+_LAST_SIZE = (0, 0)
+
 # ===============
 # Input & drawing
 # ===============
 def handle_key(stdscr, ch):
-    global board, score, won
+    global board, score, won, _DIRTY
     moved = False
     gained = 0
 
@@ -176,6 +258,7 @@ def handle_key(stdscr, ch):
         board[:] = new_board()
         score = 0
         won = False
+        _DIRTY = True
         return
 
     if moved:
@@ -183,11 +266,26 @@ def handle_key(stdscr, ch):
         spawn(board)
         if not won and max_tile(board) >= 2048:
             won = True
+        _DIRTY = True
 
 def update_draw(stdscr, dt):
-    stdscr.erase()  # clears to terminal's own background; we don't force a global bg
+    global _DIRTY, _LAST_SIZE
+    if not _ATTRS_READY:
+        _init_2048_attrs()
+
+    size = stdscr.getmaxyx()
+    if size != _LAST_SIZE:
+        _DIRTY = True
+        _LAST_SIZE = size
+        # one-shot full clear: layout depends on the size, so anything could
+        # have moved. Steady-state frames repaint every cell they own anyway,
+        # making a per-frame erase() redundant.
+        stdscr.clear()
+    if not _DIRTY:
+        return
+    _DIRTY = False
 
-    h, w = stdscr.getmaxyx()
+    h, w = size
 
     # ---------- MENU PANEL ----------
     # Content lines
@@ -202,7 +300,7 @@ def update_draw(stdscr, dt):
     menu_x = max(0, (w - menu_width) // 2)
     menu_y = 0  # top of screen
 
-    menu_attr_bg = get_color(bg=MENU_BG, fg=MENU_FG)    # bg+fg set
+    menu_attr_bg = _MENU_ATTR
     draw_rect(stdscr, menu_y, menu_x, menu_height, menu_width, menu_attr_bg)
     # Write lines centered inside
     for i, s in enumerate(lines):
@@ -235,51 +333,30 @@ def update_draw(stdscr, dt):
         stdscr.refresh()
         return
 
-    # Border rectangle
-    border_attr = get_color(bg=BORDER_BG, fg=BORDER_FG)
-    draw_rect(stdscr, starty, startx, outer_h, outer_w, border_attr)
+    global _BOARD_PAD
+    if _BOARD_PAD is None:
+        _BOARD_PAD = curses.newpad(outer_h + 1, outer_w + 1)
+    pad = _BOARD_PAD
+
+    # Border rectangle (pad-local coordinates from here on)
+    draw_rect(pad, 0, 0, outer_h, outer_w, _BORDER_ATTR)
 
     # Inner area origin (top-left corner of the grid)
-    inner_y = starty + bs
-    inner_x = startx + bs + 1
+    inner_y = bs
+    inner_x = bs + 1
 
     # Fill inner area with “gap” background first (solid board background)
-    gap_attr = get_color(bg=GAP_BG, fg=GAP_FG)
-    draw_rect(stdscr, inner_y, inner_x, gridh, gridw, gap_attr)
+    draw_rect(pad, inner_y, inner_x, gridh, gridw, _GAP_ATTR)
 
     # Draw each tile (colored blocks) over the gap background
+    addstr = pad.addstr
+    cerr = curses.error
     for r in range(SIZE):
         for c in range(SIZE):
             v = board[r][c]
             s = fmt_tile(v)
-            # choose tile color based on value
-            # simple cyclic palette: bump lightness with value
-            # map by exponent to a few named backgrounds for better looks
-            if v == 0:
-                tile_bg = ("gray", "base")
-            else:
-                exp = v.bit_length() - 1
-                # a small cycle through named colors
-                palette = [
-                    ("blue", "light"),
-                    ("cyan", "base"),
-                    ("green", "base"),
-                    ("yellow", "base"),
-                    ("orange", "base"),
-                    ("magenta", "base"),
-                    ("red", "base"),
-                    ("purple", "base"),
-                    ("gold", "base"),
-                    ("pink", "base"),
-                    ("lime", "base"),
-                    ("blue", "base"),
-                    ("cyan", "light"),
-                    ("green", "light"),
-                    ("yellow", "light"),
-                    ("orange", "light"),
-                ]
-                tile_bg = palette[(exp - 1) % len(palette)]
-            tile_attr = get_color(bg=tile_bg)  # auto-contrast fg
+            # tile color keyed by exponent; precomputed at init
+            tile_attr = _ZERO_TILE_ATTR if v == 0 else _TILE_ATTRS[v.bit_length() - 1]
 
             # Tile top-left
             x = inner_x + c * (TILE_W + H_GAP)
@@ -288,29 +365,42 @@ def update_draw(stdscr, dt):
             # Fill tile rectangle
             for dy in range(TILE_H):
                 try:
-                    stdscr.addstr(y + dy, x, " " * TILE_W, tile_attr)
-                except curses.error:
+                    addstr(y + dy, x, _BLANK_TILE_ROW, tile_attr)
+                except cerr:
                     pass
 
             # Number centered on the middle row
             text_y = y + TILE_H // 2
             text_x = x + (TILE_W - len(s)) // 2
             try:
-                stdscr.addstr(text_y, text_x, s, tile_attr | curses.A_BOLD if v >= 1024 else tile_attr)
-            except curses.error:
+                addstr(text_y, text_x, s, tile_attr | curses.A_BOLD if v >= 1024 else tile_attr)
+            except cerr:
                 pass
 
-    # Win/lose messages (draw under the board area)
+    # Win/lose messages (draw under the board area, on the main screen)
     msg = None
     if not has_moves(board):
         msg = "Game Over — press r to restart or q to quit"
     elif won:
         msg = "You made 2048! Keep going… (r to reset)"
 
+    # blank the message row first — without a frame-wide erase, a stale
+    # "Game Over" would otherwise survive a reset
+    msg_y = starty + bs + gridh + 1
+    try:
+        stdscr.move(msg_y, 0)
+        stdscr.clrtoeol()
+    except curses.error:
+        pass
     if msg:
-        draw_text_center(stdscr, inner_y + gridh + 1, 0, w, msg, curses.A_BOLD)
-
-    stdscr.refresh()
+        draw_text_center(stdscr, msg_y, 0, w, msg, curses.A_BOLD)
+
+    # Stage both surfaces, then flush everything in one screen update
+    stdscr.noutrefresh()
+    pad.noutrefresh(0, 0, starty, startx,
+                    min(h - 1, starty + outer_h - 1),
+                    min(w - 1, startx + outer_w - 1))
+    curses.doupdate()
 
 # -----------
 # Entry point
@@ -69,11 +69,32 @@ def _hex_to_rgb(h: str) -> Tuple[int,int,int]:
     h = h.lstrip("#")
     return int(h[0:2],16), int(h[2:4],16), int(h[4:6],16)
 
+def _nearest_cube_level(v: int) -> int:
+    # index into [0,95,135,175,215,255]; thresholds are the midpoints,
+    # with exact midpoints going to the lower level (lower palette index)
+    if v < 48:   return 0
+    if v <= 115: return 1
+    if v <= 155: return 2
+    if v <= 195: return 3
+    if v <= 235: return 4
+    return 5
+
 def _nearest_index(r:int,g:int,b:int) -> int:
+    # O(1) quantizer: the nearest 6x6x6 cube entry is found per channel and the
+    # nearest grayscale-ramp entry analytically; only the 16 standard colors
+    # still need a scan. ~20 candidates instead of 256, with the same result as
+    # the old full linear search (ties resolve to the lowest index, as before).
+    ri, gi, bi = _nearest_cube_level(r), _nearest_cube_level(g), _nearest_cube_level(b)
+    # grayscale ramp 232..255 holds (v,v,v) for v = 8,18,...,238; distance is
+    # minimized near the channel mean, so try the two bracketing entries
+    gi0 = min(23, max(0, (r + g + b - 24) // 30))
+    candidates = [16 + 36 * ri + 6 * gi + bi, 232 + gi0, 232 + min(23, gi0 + 1)]
+    candidates.extend(range(16))
     best_i, best_d = 0, 1e18
-    for i,(rr,gg,bb) in enumerate(_XTERM256):
+    for i in candidates:
+        rr, gg, bb = _XTERM256[i]
         d = (r-rr)*(r-rr)+(g-gg)*(g-gg)+(b-bb)*(b-bb)
-        if d < best_d:
+        if d < best_d or (d == best_d and i < best_i):
             best_d, best_i = d, i
     return best_i
 
@@ -84,6 +105,21 @@ for name, variants in COLOR_HEX.items():
     for vname, hexv in variants.items():
         COLOR_IDX[name][vname] = _nearest_index(*_hex_to_rgb(hexv))
 
+def register_color(name: str, **variants: str) -> None:
+    """Add or extend a named color at runtime, e.g. for app themes.
+
+        register_color("teal", dark="#005F5F", base="#009999", light="#66CCCC")
+
+    Variants are quantized once on registration (the O(1) quantizer keeps
+    this cheap no matter how many colors a theme adds), then usable with
+    get_color like the built-in palette.
+    """
+    hexes = COLOR_HEX.setdefault(name, {})
+    idxs = COLOR_IDX.setdefault(name, {})
+    for vname, hexv in variants.items():
+        hexes[vname] = hexv
+        idxs[vname] = _nearest_index(*_hex_to_rgb(hexv))
+
 # --------------------------------
 # 3) curses helpers
 # --------------------------------
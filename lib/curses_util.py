@@ -1,5 +1,5 @@
 import curses
-from time import time, sleep
+from time import time
 
 def init():
     stdscr = curses.initscr()        # start curses, get main screen
@@ -22,30 +22,39 @@ def teardown(stdscr):
 
 def mainloop(update_draw, handle_key, fps=30):
     stdscr = init()
-    stdscr.nodelay(True)  # non-blocking getch()
     delta_time_target = 1.0 / fps
+    frame_delay = delta_time_target
     last = time()
     try:
         while True:
-            # --- TIMING ---
-            now = time()
-            delta_time = now - last
-            if delta_time < delta_time_target:
-                sleep(delta_time_target - delta_time)   # wait if running too fast
-                now = time()
-                delta_time = now - last
-            last = now
-
-            # --- INPUT ---
-            while True:
-                ch = stdscr.getch()
-                if ch == -1:         # no more keys in buffer
-                    break
+            # --- INPUT / TIMING ---
+            # getch() itself blocks for up to one frame, so an idle frame is
+            # a single timed read instead of sleep + a wasted poll, and a
+            # keypress wakes us immediately instead of after the sleep
+            stdscr.timeout(max(0, int(frame_delay * 1000)))
+            ch = stdscr.getch()
+            if ch != -1:
                 if ch in (ord('q'), 27):  # quit if 'q' or ESC
                     return
                 handle_key(stdscr, ch)    # pass key to game logic
+                stdscr.timeout(0)         # drain any buffered keys
+                while True:
+                    ch = stdscr.getch()
+                    if ch == -1:          # no more keys in buffer
+                        break
+                    if ch in (ord('q'), 27):
+                        return
+                    handle_key(stdscr, ch)
+
+            now = time()
+            delta_time = now - last
+            last = now
 
             # --- UPDATE & DRAW ---
-            update_draw(stdscr, delta_time)
+            # apps may return how long to wait before the next frame
+            # (e.g. the clock sleeps until the next half-second tick);
+            # None means "keep the fixed fps cadence"
+            delay = update_draw(stdscr, delta_time)
+            frame_delay = delta_time_target if delay is None else max(0.0, delay)
     finally:
         teardown(stdscr)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# PiGames/tests/test_clock_render.py
+"""
+Regression tests for the clock's shadow-buffer rendering.
+
+Renders consecutive frames through _flush_frame onto a fake screen and
+asserts the result matches a from-scratch render — guarding against stale
+cells when a glyph transition shortens a pixel run (e.g. seconds 2→3 or the
+5→0 tens rollover), which the original span-keyed shadow diff missed.
+"""
+
+import importlib
+import os
+import sys
+import unittest
+
+_PKG_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(_PKG_DIR))
+clock = importlib.import_module(os.path.basename(_PKG_DIR) + ".apps.clock")
+
+
+class FakeScreen:
+    """Captures addstr output as a (y, x) -> (ch, attr) cell map."""
+
+    def __init__(self):
+        self.cells = {}
+
+    def addstr(self, y, x, s, attr=0):
+        for j, ch in enumerate(s):
+            self.cells[(y, x + j)] = (ch, attr)
+
+    def visible(self):
+        return {k: v for k, v in self.cells.items() if v[0] != " "}
+
+
+def _render_flushed(scr, text, colon_on=True):
+    frame = {}
+    clock.render_big_text(frame, 0, 0, text, colon_on=colon_on)
+    clock._flush_frame(scr, frame)
+
+
+class FlushFrameTest(unittest.TestCase):
+    def setUp(self):
+        clock._SHADOW = {}
+
+    def tearDown(self):
+        clock._SHADOW = {}
+
+    def _fresh_screen(self, text, colon_on=True):
+        clock._SHADOW = {}
+        scr = FakeScreen()
+        _render_flushed(scr, text, colon_on=colon_on)
+        return scr
+
+    def test_all_glyph_transitions_leave_no_stale_cells(self):
+        glyphs = "0123456789:"
+        for a in glyphs:
+            for b in glyphs:
+                clock._SHADOW = {}
+                scr = FakeScreen()
+                _render_flushed(scr, a)
+                _render_flushed(scr, b)
+                self.assertEqual(scr.visible(),
+                                 self._fresh_screen(b).visible(),
+                                 f"stale cells after {a!r} -> {b!r}")
+
+    def test_minute_rollover_full_string(self):
+        scr = FakeScreen()
+        for t in ("12:02:58", "12:02:59", "12:03:00"):
+            _render_flushed(scr, t)
+        self.assertEqual(scr.visible(),
+                         self._fresh_screen("12:03:00").visible())
+
+    def test_colon_blink_clears_and_restores(self):
+        scr = FakeScreen()
+        _render_flushed(scr, "12:34", colon_on=True)
+        _render_flushed(scr, "12:34", colon_on=False)
+        self.assertEqual(scr.visible(),
+                         self._fresh_screen("12:34", colon_on=False).visible())
+        _render_flushed(scr, "12:34", colon_on=True)
+        self.assertEqual(scr.visible(),
+                         self._fresh_screen("12:34", colon_on=True).visible())
+
+
+if __name__ == "__main__":
+    unittest.main()